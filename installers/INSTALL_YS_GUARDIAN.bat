@@ -95,6 +95,10 @@ REM Copy snapshot manager
 copy /Y "%PLUGIN_DIR%\redshift_snapshot_manager_fixed.py" "%DEST_DIR%\redshift_snapshot_manager_fixed.py" >nul
 if %errorlevel% equ 0 (echo [OK] Snapshot manager) else (echo [FAILED] Snapshot manager)
 
+REM Copy shared snapshot log helper
+copy /Y "%PLUGIN_DIR%\snapshot_logging.py" "%DEST_DIR%\snapshot_logging.py" >nul
+if %errorlevel% equ 0 (echo [OK] Snapshot logging) else (echo [FAILED] Snapshot logging)
+
 REM Copy simple converter (bridges to external converter)
 copy /Y "%PLUGIN_DIR%\exr_to_png_converter_simple.py" "%DEST_DIR%\exr_to_png_converter_simple.py" >nul
 if %errorlevel% equ 0 (echo [OK] Simple converter bridge) else (echo [FAILED] Simple converter)
@@ -202,6 +206,7 @@ if %PYTHON_FOUND% equ 0 (
     echo   - pip install Pillow
     echo   - pip install numpy
     echo   - pip install OpenEXR (optional, for better HDR support)
+    echo   - pip install numba (optional, for faster ACES conversion)
     echo.
 ) else (
     echo.
@@ -224,6 +229,12 @@ if %PYTHON_FOUND% equ 0 (
     if %errorlevel% neq 0 (
         echo [OPTIONAL] OpenEXR - For better HDR support: %PYTHON_CMD% -m pip install OpenEXR-Python
     )
+
+    REM Check for Numba
+    %PYTHON_CMD% -c "import numba; print('[OK] Numba version:', numba.__version__)" 2>nul
+    if %errorlevel% neq 0 (
+        echo [OPTIONAL] Numba - For faster ACES conversion: %PYTHON_CMD% -m pip install numba
+    )
 )
 
 echo.
@@ -37,6 +37,12 @@ if exist "%PLUGIN_DIR%" (
     ) else (
         echo [✗] MISSING: redshift_snapshot_manager_fixed.py
     )
+
+    if exist "%PLUGIN_DIR%\snapshot_logging.py" (
+        echo [✓] Snapshot logging present
+    ) else (
+        echo [✗] MISSING: snapshot_logging.py
+    )
 ) else (
     echo [✗] Plugin directory NOT found!
     echo     Expected location: %PLUGIN_DIR%
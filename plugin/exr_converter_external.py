@@ -7,6 +7,10 @@ Uses system Python with OpenEXR and Pillow
 
 import sys
 import os
+import io
+import json
+import contextlib
+import traceback
 import numpy as np
 from PIL import Image
 
@@ -19,6 +23,108 @@ except ImportError:
     HAS_OPENEXR = False
     print("Warning: OpenEXR not available, will try Pillow only")
 
+# OpenEXR 3.x bindings can decode with the library's own thread pool
+if HAS_OPENEXR and hasattr(OpenEXR, 'set_global_thread_count'):
+    OpenEXR.set_global_thread_count(os.cpu_count() or 1)
+
+# Try to import Numba (optional, fuses the display transform into one pass)
+try:
+    from numba import njit, prange, types
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# ACEScg to linear sRGB matrix
+# This matrix accounts for the different primaries between ACEScg and sRGB
+_ACESCG_TO_SRGB = np.array([
+    [ 1.70505, -0.62179, -0.08326],
+    [-0.13026,  1.14080, -0.01055],
+    [-0.02400, -0.12897,  1.15297]
+], dtype=np.float32)
+
+# Transposed once at import so every conversion hits a contiguous matrix
+_ACESCG_TO_SRGB_T = np.ascontiguousarray(_ACESCG_TO_SRGB.T)
+
+# Used in place of the ACEScg matrix when the data already has sRGB primaries
+_IDENTITY_MATRIX = np.eye(3, dtype=np.float32)
+
+# Rec.709/sRGB primaries (red, green, blue) as stored in the EXR chromaticities
+_SRGB_PRIMARIES = ((0.64, 0.33), (0.30, 0.60), (0.15, 0.06))
+
+
+def _build_srgb_lut(size):
+    """Build an 8-bit sRGB OETF lookup table over [0, 1]
+    Output is quantized to 8-bit anyway, so the per-pixel power function
+    is evaluated once per table entry instead of once per pixel
+    """
+    x = np.linspace(0.0, 1.0, size)
+
+    # This is the proper sRGB transfer function
+    # Linear segment everywhere, power segment only where it applies
+    srgb = x * 12.92
+    upper = x > 0.0031308
+    srgb[upper] = 1.055 * np.power(x[upper], 1.0/2.4) - 0.055
+
+    return np.clip(srgb * 255, 0, 255)
+
+
+# 16-bit index -> 8-bit sRGB value (the *255, clip and cast are folded in)
+_SRGB_LUT_SIZE = 65536
+_SRGB_LUT = _build_srgb_lut(_SRGB_LUT_SIZE).astype(np.uint8)
+
+# ACES tone mapping curve coefficients
+# (float32 so float32 input is never promoted to float64)
+_ACES_EXPOSURE = np.float32(0.6)
+_ACES_A = np.float32(2.51)
+_ACES_B = np.float32(0.03)
+_ACES_C = np.float32(2.43)
+_ACES_D = np.float32(0.59)
+_ACES_E = np.float32(0.14)
+
+# Row/column stride for the value-range sample used by 'auto' mode
+_RANGE_SAMPLE_STRIDE = 8
+
+
+if HAS_NUMBA:
+    # Numba compiles for the CPU it runs on (AVX2/FMA where available, baseline
+    # otherwise) and keys its on-disk cache by CPU, so no per-CPU builds are
+    # needed. Explicit signatures compile (or load from cache) at import,
+    # which happens once when the converter daemon starts, not mid-snapshot.
+    # Contiguous frames get the C-layout version; strided views (e.g. RGB
+    # sliced out of RGBA) fall back to the any-layout one. Each comes in a
+    # read-only variant too (e.g. np.frombuffer views), since explicit
+    # signatures disable lazy compilation for anything not listed.
+    _KERNEL_SIGNATURES = [
+        types.void(types.Array(types.float32, 3, layout, readonly=readonly),
+                   types.Array(types.uint8, 3, 'C'),
+                   types.Array(types.float32, 2, 'C'),
+                   types.Array(types.uint8, 1, 'C'))
+        for layout in ('C', 'A')
+        for readonly in (False, True)
+    ]
+
+    # fastmath without the no-NaN/no-Inf flags so the NaN guard below stays
+    @njit(_KERNEL_SIGNATURES, parallel=True, cache=True,
+          fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+    def _display_transform_kernel(src, dst, matrix, lut):
+        """Matrix, ACES curve and sRGB table lookup for each pixel in one pass"""
+        lut_max = lut.shape[0] - 1
+        for i in prange(src.shape[0]):
+            for j in range(src.shape[1]):
+                r = src[i, j, 0]
+                g = src[i, j, 1]
+                b = src[i, j, 2]
+                for k in range(3):
+                    x = matrix[k, 0] * r + matrix[k, 1] * g + matrix[k, 2] * b
+                    x *= _ACES_EXPOSURE
+                    v = (x * (_ACES_A * x + _ACES_B)) / (x * (_ACES_C * x + _ACES_D) + _ACES_E)
+                    # Clamp to [0, 1] (NaN goes to black)
+                    if not v > 0.0:
+                        v = 0.0
+                    elif v > 1.0:
+                        v = 1.0
+                    dst[i, j, k] = lut[int(v * lut_max + 0.5)]
+
 
 def apply_aces_tone_mapping(linear_rgb):
     """Apply ACES RRT/ODT tone mapping approximation
@@ -26,74 +132,204 @@ def apply_aces_tone_mapping(linear_rgb):
     """
     # ACES RRT/ODT approximation
     # Based on the ACES filmic tone mapping curve
-    x = linear_rgb
+    # Evaluated in place so a 4K frame isn't copied into a fresh
+    # temporary for every arithmetic step
 
     # Exposure adjustment (ACES uses 0.6 exposure by default)
-    x = x * 0.6
+    x = np.multiply(linear_rgb, _ACES_EXPOSURE)
+
+    # Numerator: x*(a*x+b)
+    result = np.multiply(x, _ACES_A)
+    result += _ACES_B
+    result *= x
 
-    # ACES tone mapping matrix coefficients
-    a = 2.51
-    b = 0.03
-    c = 2.43
-    d = 0.59
-    e = 0.14
+    # Denominator: x*(c*x+d)+e (reuses the exposure buffer)
+    denominator = np.multiply(x, _ACES_C)
+    denominator += _ACES_D
+    np.multiply(denominator, x, out=x)
+    x += _ACES_E
 
     # Apply the ACES curve
-    result = ((x*(a*x+b))/(x*(c*x+d)+e))
+    result /= x
 
-    return np.clip(result, 0, 1)
+    return np.clip(result, 0, 1, out=result)
 
 
 def acescg_to_linear_srgb(acescg):
     """Convert from ACEScg color space to linear sRGB
     Uses the proper ACEScg to sRGB primaries transformation
     """
-    # ACEScg to linear sRGB matrix
-    # This matrix accounts for the different primaries between ACEScg and sRGB
-    matrix = np.array([
-        [ 1.70505, -0.62179, -0.08326],
-        [-0.13026,  1.14080, -0.01055],
-        [-0.02400, -0.12897,  1.15297]
-    ])
-
-    # Reshape for matrix multiplication
-    shape = acescg.shape
-    pixels = acescg.reshape(-1, 3)
-
     # Apply the color space transformation
-    linear_srgb = np.dot(pixels, matrix.T)
+    # (matmul broadcasts over the HxW axes, no reshape/copy needed)
+    return acescg @ _ACESCG_TO_SRGB_T
 
-    # Reshape back
-    return linear_srgb.reshape(shape)
 
+def encode_srgb_8bit(linear_rgb):
+    """Encode linear [0, 1] values to 8-bit sRGB through the OETF lookup table"""
+    # Scale to a rounded 16-bit table index (values outside [0, 1] clamp)
+    scaled = np.multiply(linear_rgb, np.float32(_SRGB_LUT_SIZE - 1), dtype=np.float32)
+    scaled += np.float32(0.5)
+    np.clip(scaled, 0, _SRGB_LUT_SIZE - 1, out=scaled)
 
-def apply_redshift_display_transform(linear_rgb):
+    return _SRGB_LUT[scaled.astype(np.uint16)]
+
+
+def apply_redshift_display_transform(linear_rgb, is_acescg=True):
     """Apply a display transform that mimics Redshift's RenderView
     Combines ACES tone mapping with proper sRGB encoding
+    Returns an 8-bit sRGB image ready to save
+
+    Args:
+        linear_rgb: Scene-linear RGB image (HxWx3)
+        is_acescg: True if the data has ACEScg primaries, False if it is
+                   already in sRGB primaries (skips the matrix)
     """
+    # All color math runs in float32
+    linear_rgb = np.asarray(linear_rgb, dtype=np.float32)
+
+    if HAS_NUMBA:
+        # Single fused pass straight into the 8-bit output buffer
+        rgb_8bit = np.empty(linear_rgb.shape, dtype=np.uint8)
+        matrix = _ACESCG_TO_SRGB if is_acescg else _IDENTITY_MATRIX
+        _display_transform_kernel(linear_rgb, rgb_8bit, matrix, _SRGB_LUT)
+        return rgb_8bit
+
     # Step 1: Convert from ACEScg to linear sRGB if needed
-    # (Assuming input is in ACEScg space as that's Redshift's default)
-    linear_srgb = acescg_to_linear_srgb(linear_rgb)
+    if is_acescg:
+        linear_srgb = acescg_to_linear_srgb(linear_rgb)
+    else:
+        linear_srgb = linear_rgb
 
     # Step 2: Apply ACES tone mapping
     tone_mapped = apply_aces_tone_mapping(linear_srgb)
 
     # Step 3: Apply sRGB OETF (not simple gamma!)
-    # This is the proper sRGB transfer function
-    srgb = np.where(
-        tone_mapped <= 0.0031308,
-        tone_mapped * 12.92,
-        1.055 * np.power(tone_mapped, 1.0/2.4) - 0.055
-    )
+    return encode_srgb_8bit(tone_mapped)
+
+
+def apply_simple_gamma(linear_rgb):
+    """Apply legacy simple gamma 2.2 and return an 8-bit image"""
+    # Clip once into a single float32 working buffer, then do the rest in place
+    display_rgb = np.empty(np.shape(linear_rgb), dtype=np.float32)
+    np.clip(linear_rgb, 0, 1, out=display_rgb)
+    np.power(display_rgb, np.float32(1.0/2.2), out=display_rgb)
+
+    # Scale to 8-bit in place; the input clip already bounds it to [0, 255]
+    display_rgb *= np.float32(255)
+    return display_rgb.astype(np.uint8)
+
+
+# Display pipelines keyed by color mode: (description, transform)
+# Every transform takes (linear_rgb, is_acescg) and returns 8-bit sRGB
+_PIPELINES = {
+    # Full ACES display transform (Redshift default)
+    'aces': ("Redshift/ACES display transform", apply_redshift_display_transform),
+    # Legacy simple gamma 2.2
+    'simple': ("simple gamma 2.2 correction",
+               lambda linear_rgb, is_acescg: apply_simple_gamma(linear_rgb)),
+    # Just apply sRGB encoding, no tone mapping
+    'linear': ("sRGB encoding (no tone mapping)",
+               lambda linear_rgb, is_acescg: encode_srgb_8bit(linear_rgb)),
+}
+
+
+def _is_acescg_header(header):
+    """Check the EXR chromaticities to see if the data has ACEScg primaries
+    Files without chromaticities are assumed to be ACEScg (Redshift's default)
+    """
+    if 'chromaticities' not in header:
+        return True
 
-    return np.clip(srgb, 0, 1)
+    chroma = header['chromaticities']
+    if hasattr(chroma, 'red'):
+        # Legacy bindings: Imath.Chromaticities
+        primaries = [(p.x, p.y) for p in (chroma.red, chroma.green, chroma.blue)]
+    else:
+        # OpenEXR 3.x bindings: flat (rx, ry, gx, gy, bx, by, wx, wy) tuple
+        primaries = [chroma[0:2], chroma[2:4], chroma[4:6]]
+
+    # Anything that doesn't declare sRGB primaries keeps the ACEScg matrix
+    for (px, py), (x, y) in zip(primaries, _SRGB_PRIMARIES):
+        if abs(px - x) > 0.01 or abs(py - y) > 0.01:
+            return True
+    return False
+
+
+def _pick_rgb_channels(channels):
+    """Pick the three channel names to read as R, G, B"""
+    if 'R' in channels and 'G' in channels and 'B' in channels:
+        return ['R', 'G', 'B']
+    if 'r' in channels and 'g' in channels and 'b' in channels:
+        return ['r', 'g', 'b']
+
+    # Try to get any three channels
+    chan_list = list(channels)
+    if len(chan_list) >= 3:
+        return chan_list[:3]
+    raise Exception(f"Not enough channels in EXR: {chan_list}")
+
+
+def _read_exr_file(filepath):
+    """Read EXR using the OpenEXR 3.x File API (multi-threaded decode)"""
+    with OpenEXR.File(filepath) as exr_file:
+        header = exr_file.header()
+        channels = exr_file.channels()
+
+        # Check for color space metadata in header
+        print(f"EXR Header channels: {list(channels.keys())}")
+
+        # Check for any color space attributes
+        if 'chromaticities' in header:
+            print(f"Chromaticities found: {header['chromaticities']}")
+        if 'whiteLuminance' in header:
+            print(f"White luminance: {header['whiteLuminance']}")
+
+        is_acescg = _is_acescg_header(header)
+
+        # R, G, B (and A) come back already interleaved into one array,
+        # keyed 'RGB'/'RGBA' or by layer name (e.g. 'beauty' for beauty.R/G/B)
+        grouped = [name for name in ('RGB', 'RGBA') if name in channels]
+        grouped += [name for name, channel in channels.items()
+                    if name not in grouped
+                    and channel.pixels.ndim == 3 and channel.pixels.shape[-1] >= 3]
+        if grouped:
+            pixels = channels[grouped[0]].pixels[..., :3]
+            return np.asarray(pixels, dtype=np.float32), is_acescg
+
+        # Otherwise copy three single channels into an interleaved buffer
+        single = [name for name, channel in channels.items() if channel.pixels.ndim == 2]
+        rgb_names = _pick_rgb_channels(single)
+        first = channels[rgb_names[0]].pixels
+        rgb = np.empty(first.shape + (3,), dtype=np.float32)
+        for i, name in enumerate(rgb_names):
+            np.copyto(rgb[..., i], channels[name].pixels, casting='unsafe')
+
+        return rgb, is_acescg
 
 
 def read_exr_openexr(filepath):
-    """Read EXR using OpenEXR library"""
+    """Read EXR using OpenEXR library
+
+    Returns:
+        (rgb, is_acescg) - float32 HxWx3 image and whether it has ACEScg primaries
+    """
+    if hasattr(OpenEXR, 'File'):
+        return _read_exr_file(filepath)
+
     exr_file = OpenEXR.InputFile(filepath)
     header = exr_file.header()
 
+    # Check for color space metadata in header
+    print(f"EXR Header channels: {list(header['channels'].keys())}")
+
+    # Check for any color space attributes
+    if 'chromaticities' in header:
+        print(f"Chromaticities found: {header['chromaticities']}")
+    if 'whiteLuminance' in header:
+        print(f"White luminance: {header['whiteLuminance']}")
+
+    is_acescg = _is_acescg_header(header)
+
     # Get image dimensions
     dw = header['dataWindow']
     width = dw.max.x - dw.min.x + 1
@@ -106,33 +342,17 @@ def read_exr_openexr(filepath):
     channels = header['channels'].keys()
 
     # Try to find RGB channels
-    if 'R' in channels and 'G' in channels and 'B' in channels:
-        r_str = exr_file.channel('R', pt)
-        g_str = exr_file.channel('G', pt)
-        b_str = exr_file.channel('B', pt)
-    elif 'r' in channels and 'g' in channels and 'b' in channels:
-        r_str = exr_file.channel('r', pt)
-        g_str = exr_file.channel('g', pt)
-        b_str = exr_file.channel('b', pt)
-    else:
-        # Try to get any three channels
-        chan_list = list(channels)
-        if len(chan_list) >= 3:
-            r_str = exr_file.channel(chan_list[0], pt)
-            g_str = exr_file.channel(chan_list[1], pt)
-            b_str = exr_file.channel(chan_list[2], pt)
-        else:
-            raise Exception(f"Not enough channels in EXR: {chan_list}")
+    rgb_names = _pick_rgb_channels(channels)
 
-    # Convert to numpy arrays
-    r = np.frombuffer(r_str, dtype=np.float32).reshape((height, width))
-    g = np.frombuffer(g_str, dtype=np.float32).reshape((height, width))
-    b = np.frombuffer(b_str, dtype=np.float32).reshape((height, width))
+    # Read all three channels in one call
+    channel_data = exr_file.channels(rgb_names, pt)
 
-    # Stack into RGB image
-    rgb = np.stack([r, g, b], axis=-1)
+    # Copy each channel straight into an interleaved RGB buffer
+    rgb = np.empty((height, width, 3), dtype=np.float32)
+    for i, data in enumerate(channel_data):
+        np.copyto(rgb[..., i], np.frombuffer(data, dtype=np.float32).reshape((height, width)))
 
-    return rgb
+    return rgb, is_acescg
 
 
 def convert_exr_to_png(exr_path, png_path, color_mode='auto'):
@@ -156,27 +376,17 @@ def convert_exr_to_png(exr_path, png_path, color_mode='auto'):
             try:
                 print(f"Reading EXR with OpenEXR: {exr_path}")
 
-                # Read the EXR file
-                exr_file = OpenEXR.InputFile(exr_path)
-                header = exr_file.header()
-
-                # Check for color space metadata in header
-                print(f"EXR Header channels: {list(header['channels'].keys())}")
-
-                # Check for any color space attributes
-                if 'chromaticities' in header:
-                    print(f"Chromaticities found: {header['chromaticities']}")
-                if 'whiteLuminance' in header:
-                    print(f"White luminance: {header['whiteLuminance']}")
-
                 # Read the image data
-                linear_rgb = read_exr_openexr(exr_path)
+                linear_rgb, is_acescg = read_exr_openexr(exr_path)
+                print(f"Source primaries: {'ACEScg' if is_acescg else 'sRGB'}")
 
                 # Check value range to understand the data
-                min_value = np.min(linear_rgb)
-                max_value = np.max(linear_rgb)
-                avg_value = np.mean(linear_rgb)
-                print(f"EXR value range: min={min_value:.3f}, max={max_value:.3f}, avg={avg_value:.3f}")
+                # (a 1-in-64 pixel sample is plenty to tell HDR from SDR)
+                sample = linear_rgb[::_RANGE_SAMPLE_STRIDE, ::_RANGE_SAMPLE_STRIDE]
+                min_value = float(sample.min())
+                max_value = float(sample.max())
+                avg_value = float(sample.mean())
+                print(f"EXR value range (sampled): min={min_value:.3f}, max={max_value:.3f}, avg={avg_value:.3f}")
 
                 # Determine which color mode to use
                 if color_mode == 'auto':
@@ -191,44 +401,24 @@ def convert_exr_to_png(exr_path, png_path, color_mode='auto'):
                     actual_mode = color_mode
                     print(f"Using {actual_mode} color mode")
 
-                # Apply the appropriate color transform
-                if actual_mode == 'aces':
-                    # Full ACES display transform (Redshift default)
-                    print("Applying Redshift/ACES display transform...")
-                    display_rgb = apply_redshift_display_transform(linear_rgb)
-
-                elif actual_mode == 'simple':
-                    # Legacy simple gamma 2.2
-                    print("Applying simple gamma 2.2 correction...")
-                    display_rgb = np.power(np.clip(linear_rgb, 0, 1), 1.0/2.2)
-
-                elif actual_mode == 'linear':
-                    # Just apply sRGB encoding, no tone mapping
-                    print("Applying sRGB encoding (no tone mapping)...")
-                    display_rgb = np.where(
-                        linear_rgb <= 0.0031308,
-                        linear_rgb * 12.92,
-                        1.055 * np.power(np.clip(linear_rgb, 0, 1), 1.0/2.4) - 0.055
-                    )
-                    display_rgb = np.clip(display_rgb, 0, 1)
-
-                else:
+                if actual_mode not in _PIPELINES:
                     # Default to ACES
                     print(f"Unknown mode '{actual_mode}', defaulting to ACES")
-                    display_rgb = apply_redshift_display_transform(linear_rgb)
+                    actual_mode = 'aces'
 
-                # Convert to 8-bit
-                rgb_8bit = np.clip(display_rgb * 255, 0, 255).astype(np.uint8)
+                # Apply the appropriate color transform
+                description, transform = _PIPELINES[actual_mode]
+                print(f"Applying {description}...")
+                rgb_8bit = transform(linear_rgb, is_acescg)
 
                 # Save with PIL using maximum quality settings
                 img = Image.fromarray(rgb_8bit)
 
-                # Save with maximum PNG quality (no compression)
-                img.save(png_path, 'PNG',
-                        compress_level=0,  # No compression (0-9, 0 is none)
-                        optimize=False)    # Don't optimize file size
+                # PNG is lossless at every level; level 1 is nearly as fast
+                # as storing raw but writes a fraction of the bytes
+                img.save(png_path, 'PNG', compress_level=1)
 
-                print(f"SUCCESS: Converted with ACES display transform to {png_path}")
+                print(f"SUCCESS: Converted with {description} to {png_path}")
                 return True
 
             except Exception as e:
@@ -246,53 +436,72 @@ def convert_exr_to_png(exr_path, png_path, color_mode='auto'):
             print(f"Converting from {img.mode} to RGB")
             img = img.convert('RGB')
 
-        # Get image as numpy array for processing
-        img_array = np.array(img, dtype=np.float32) / 255.0
-
-        # Check value range for PIL data
-        min_val = np.min(img_array)
-        max_val = np.max(img_array)
+        # Check value range for PIL data (computed by PIL, no array copy)
+        extrema = img.getextrema()
+        min_val = min(band[0] for band in extrema) / 255.0
+        max_val = max(band[1] for band in extrema) / 255.0
         print(f"PIL data range: min={min_val:.3f}, max={max_val:.3f}")
 
-        # Apply appropriate transform for PIL fallback
-        if color_mode == 'aces' or (color_mode == 'auto' and max_val > 0.9):
-            print("Applying ACES display transform to PIL data...")
-            display_rgb = apply_redshift_display_transform(img_array)
-        elif color_mode == 'simple':
-            print("Applying simple gamma 2.2 to PIL data...")
-            display_rgb = np.power(np.clip(img_array, 0, 1), 1.0/2.2)
-        else:
-            print("Applying sRGB encoding to PIL data...")
-            display_rgb = np.where(
-                img_array <= 0.0031308,
-                img_array * 12.92,
-                1.055 * np.power(np.clip(img_array, 0, 1), 1.0/2.4) - 0.055
-            )
-            display_rgb = np.clip(display_rgb, 0, 1)
-
-        # Convert back to 8-bit
-        rgb_8bit = np.clip(display_rgb * 255, 0, 255).astype(np.uint8)
-        img = Image.fromarray(rgb_8bit)
-
-        # Save with maximum quality
-        img.save(png_path, 'PNG',
-                compress_level=0,
-                optimize=False)
-
-        print(f"SUCCESS: Converted with PIL (display transform applied) to {png_path}")
+        # PIL only hands back display-ready 8-bit sRGB, so there is no
+        # scene-linear data left to convert, tone map or encode
+        # (applying any color mode here would transform the image twice)
+        print(f"PIL data is already display-referred sRGB, skipping '{color_mode}' transform")
+
+        # Save (lossless, fast compression)
+        img.save(png_path, 'PNG', compress_level=1)
+
+        print(f"SUCCESS: Converted with PIL to {png_path}")
         return True
 
     except Exception as e:
         print(f"ERROR: Failed to convert: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
 
+def run_daemon():
+    """Serve conversions from stdin so imports/JIT are paid once per session
+
+    Each request is one line: "exr_path<TAB>png_path<TAB>color_mode"
+    Each reply is one JSON line: {"success": bool, "output": str}
+    Exits when stdin is closed
+    """
+    # Paths arrive as UTF-8 regardless of the Windows code page
+    sys.stdin.reconfigure(encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8')
+
+    for line in sys.stdin:
+        parts = line.rstrip('\n').split('\t')
+        if len(parts) < 2:
+            continue
+
+        exr_path = parts[0]
+        png_path = parts[1]
+        color_mode = parts[2] if len(parts) > 2 else 'auto'
+
+        # Capture the converter's console output so it can't mix with replies
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            if not os.path.exists(exr_path):
+                print(f"ERROR: Input file not found: {exr_path}")
+                success = False
+            else:
+                print(f"Converting with color mode: {color_mode}")
+                success = convert_exr_to_png(exr_path, png_path, color_mode)
+
+        sys.stdout.write(json.dumps({'success': success, 'output': output.getvalue()}) + '\n')
+        sys.stdout.flush()
+
+
 def main():
     """Main entry point for command line usage"""
+    if len(sys.argv) > 1 and sys.argv[1] == '--daemon':
+        run_daemon()
+        return
+
     if len(sys.argv) < 3:
         print("Usage: python exr_converter_external.py input.exr output.png [color_mode]")
+        print("       python exr_converter_external.py --daemon")
         print("Color modes: auto (default), aces, simple, linear")
         sys.exit(1)
 
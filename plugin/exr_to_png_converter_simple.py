@@ -5,6 +5,120 @@ Uses minimal dependencies that should work in C4D's Python environment
 """
 
 import os
+import json
+import queue
+import subprocess
+import threading
+import time
+import traceback
+
+from snapshot_logging import get_snapshot_logger
+
+_logger = get_snapshot_logger()
+
+# Persistent external converter process: (process, output line queue)
+_converter_daemon = None
+
+
+def _pump_lines(stream, lines):
+    """Forward a process's output lines into a queue (None marks EOF)"""
+    for line in stream:
+        lines.put(line)
+    lines.put(None)
+
+
+def _get_converter_daemon(external_converter):
+    """Start the external converter in daemon mode, or reuse the running one"""
+    global _converter_daemon
+    if _converter_daemon is not None and _converter_daemon[0].poll() is None:
+        return _converter_daemon
+
+    # Keep the console window of a long-running python.exe hidden on Windows
+    creationflags = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+
+    # UTF-8 on both ends so any Unicode project/artist path survives the pipe
+    # (the daemon reconfigures its stdin/stdout to match)
+    process = subprocess.Popen(
+        ["python", "-u", external_converter, "--daemon"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding='utf-8',
+        errors='replace',
+        bufsize=1,
+        creationflags=creationflags
+    )
+
+    # Read replies on a background thread so waiting on them can time out
+    lines = queue.Queue()
+    reader = threading.Thread(target=_pump_lines, args=(process.stdout, lines), daemon=True)
+    reader.start()
+
+    _converter_daemon = (process, lines)
+    return _converter_daemon
+
+
+def _stop_converter_daemon():
+    """Kill the daemon so the next conversion starts a fresh one"""
+    global _converter_daemon
+    if _converter_daemon is not None:
+        try:
+            _converter_daemon[0].kill()
+        except Exception:
+            pass
+        _converter_daemon = None
+
+
+def _convert_with_daemon(external_converter, exr_path, png_path, color_mode, timeout=30):
+    """Send one conversion to the external converter daemon
+
+    Returns:
+        (success, output) - the converter's result and its console output
+    """
+    request = f"{exr_path}\t{png_path}\t{color_mode}\n"
+
+    # The daemon may have died after the poll() check; restart it once
+    for attempt in range(2):
+        process, lines = _get_converter_daemon(external_converter)
+        try:
+            process.stdin.write(request)
+            process.stdin.flush()
+            break
+        except OSError:
+            _stop_converter_daemon()
+            if attempt:
+                raise
+
+    deadline = time.time() + timeout
+
+    try:
+        output = []
+        while True:
+            line = lines.get(timeout=max(deadline - time.time(), 0))
+            if line is None:
+                raise RuntimeError(f"Converter daemon exited: {''.join(output)}")
+
+            # Anything that isn't a reply (e.g. import warnings) is just output
+            try:
+                reply = json.loads(line)
+            except ValueError:
+                output.append(line)
+                continue
+            if not isinstance(reply, dict):
+                output.append(line)
+                continue
+
+            output.append(reply.get('output', ''))
+            return bool(reply.get('success')), ''.join(output)
+
+    except queue.Empty:
+        _stop_converter_daemon()
+        raise subprocess.TimeoutExpired(external_converter, timeout)
+    except Exception:
+        _stop_converter_daemon()
+        raise
+
 
 def convert_exr_to_png(exr_path, png_path, **kwargs):
     """
@@ -12,22 +126,14 @@ def convert_exr_to_png(exr_path, png_path, **kwargs):
     Uses external Python converter if available
     """
     try:
-        log_file = r"C:\YS_Guardian_Output\snapshot_log.txt"
-
         # Get color mode from kwargs (default to 'aces' for Redshift accuracy)
         color_mode = kwargs.get('color_mode', 'aces')
 
         # Log the attempt
-        try:
-            with open(log_file, 'a') as f:
-                from datetime import datetime
-                f.write(f"[{datetime.now().strftime('%H:%M:%S')}] Simple converter: Attempting conversion\n")
-                f.write(f"[{datetime.now().strftime('%H:%M:%S')}] Color mode: {color_mode}\n")
-        except:
-            pass
+        _logger.info("Simple converter: Attempting conversion")
+        _logger.info(f"Color mode: {color_mode}")
 
         # First, try to use external Python converter if available
-        import subprocess
         # Try to find the external converter in the same directory as this module
         current_dir = os.path.dirname(os.path.abspath(__file__))
         external_converter = os.path.join(current_dir, "exr_converter_external.py")
@@ -39,43 +145,30 @@ def convert_exr_to_png(exr_path, png_path, **kwargs):
 
         if os.path.exists(external_converter):
             try:
-                with open(log_file, 'a') as f:
-                    f.write(f"[{datetime.now().strftime('%H:%M:%S')}] Found external converter, using system Python...\n")
+                _logger.info("Found external converter, using system Python...")
 
-                # Call external Python with the converter script and color mode
-                result = subprocess.run(
-                    ["python", external_converter, exr_path, png_path, color_mode],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
+                # Hand the job to the persistent external Python process
+                # (started on first use, so imports are paid once per session)
+                success, output = _convert_with_daemon(external_converter, exr_path, png_path, color_mode)
 
                 # Log the output
-                with open(log_file, 'a') as f:
-                    if result.stdout:
-                        f.write(f"[{datetime.now().strftime('%H:%M:%S')}] External converter output: {result.stdout}\n")
-                    if result.stderr:
-                        f.write(f"[{datetime.now().strftime('%H:%M:%S')}] External converter errors: {result.stderr}\n")
+                if output:
+                    _logger.info(f"External converter output: {output}")
 
                 # Check if conversion was successful
-                if result.returncode == 0 and os.path.exists(png_path):
-                    with open(log_file, 'a') as f:
-                        f.write(f"[{datetime.now().strftime('%H:%M:%S')}] SUCCESS: External conversion worked!\n")
-                        f.write(f"[{datetime.now().strftime('%H:%M:%S')}] Output file: {png_path}\n")
+                if success and os.path.exists(png_path):
+                    _logger.info("SUCCESS: External conversion worked!")
+                    _logger.info(f"Output file: {png_path}")
                     return True
                 else:
-                    with open(log_file, 'a') as f:
-                        f.write(f"[{datetime.now().strftime('%H:%M:%S')}] External converter failed with code {result.returncode}\n")
+                    _logger.info("External converter failed")
 
             except subprocess.TimeoutExpired:
-                with open(log_file, 'a') as f:
-                    f.write(f"[{datetime.now().strftime('%H:%M:%S')}] External converter timed out\n")
+                _logger.info("External converter timed out")
             except Exception as e:
-                with open(log_file, 'a') as f:
-                    f.write(f"[{datetime.now().strftime('%H:%M:%S')}] External converter error: {e}\n")
+                _logger.info(f"External converter error: {e}")
         else:
-            with open(log_file, 'a') as f:
-                f.write(f"[{datetime.now().strftime('%H:%M:%S')}] External converter not found at: {external_converter}\n")
+            _logger.info(f"External converter not found at: {external_converter}")
 
         # Fallback: Check if we can import PIL (often available in C4D)
         try:
@@ -83,8 +176,7 @@ def convert_exr_to_png(exr_path, png_path, **kwargs):
 
             # Try to read the EXR directly with PIL (might work for some EXR files)
             try:
-                with open(log_file, 'a') as f:
-                    f.write(f"[{datetime.now().strftime('%H:%M:%S')}] Fallback: Trying PIL direct read...\n")
+                _logger.info("Fallback: Trying PIL direct read...")
 
                 img = Image.open(exr_path)
                 # Convert to RGB if necessary
@@ -94,21 +186,18 @@ def convert_exr_to_png(exr_path, png_path, **kwargs):
                 # Ensure output directory exists
                 os.makedirs(os.path.dirname(png_path), exist_ok=True)
 
-                # Save as PNG with maximum quality
-                img.save(png_path, 'PNG', compress_level=0, optimize=False)
+                # Save as PNG (lossless, fast compression)
+                img.save(png_path, 'PNG', compress_level=1)
 
-                with open(log_file, 'a') as f:
-                    f.write(f"[{datetime.now().strftime('%H:%M:%S')}] SUCCESS: PIL conversion worked!\n")
+                _logger.info("SUCCESS: PIL conversion worked!")
 
                 return True
 
             except Exception as e:
-                with open(log_file, 'a') as f:
-                    f.write(f"[{datetime.now().strftime('%H:%M:%S')}] PIL failed: {e}\n")
+                _logger.info(f"PIL failed: {e}")
 
         except ImportError:
-            with open(log_file, 'a') as f:
-                f.write(f"[{datetime.now().strftime('%H:%M:%S')}] PIL not available in C4D\n")
+            _logger.info("PIL not available in C4D")
 
         # If we get here, we couldn't convert the file
         # As a last resort, create a placeholder text file explaining the issue
@@ -135,28 +224,18 @@ def convert_exr_to_png(exr_path, png_path, **kwargs):
                 f.write(f"\n")
                 f.write(f"3. Use Redshift's built-in export to PNG instead of EXR\n")
 
-            with open(log_file, 'a') as f:
-                from datetime import datetime
-                f.write(f"[{datetime.now().strftime('%H:%M:%S')}] Created placeholder file: {placeholder_path}\n")
+            _logger.info(f"Created placeholder file: {placeholder_path}")
 
             # Return False but with helpful information logged
             return False
 
         except Exception as e:
-            with open(log_file, 'a') as f:
-                from datetime import datetime
-                f.write(f"[{datetime.now().strftime('%H:%M:%S')}] Failed to create placeholder: {e}\n")
+            _logger.info(f"Failed to create placeholder: {e}")
             return False
 
     except Exception as e:
-        try:
-            with open(log_file, 'a') as f:
-                from datetime import datetime
-                import traceback
-                f.write(f"[{datetime.now().strftime('%H:%M:%S')}] Simple converter error: {e}\n")
-                f.write(f"[{datetime.now().strftime('%H:%M:%S')}] Traceback: {traceback.format_exc()}\n")
-        except:
-            pass
+        _logger.info(f"Simple converter error: {e}")
+        _logger.info(f"Traceback: {traceback.format_exc()}")
         return False
 
 def get_converter_info():
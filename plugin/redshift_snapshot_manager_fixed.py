@@ -5,8 +5,13 @@ Directly grabs EXR files from cache folder and converts them
 """
 
 import os
+import shutil
+import time
+import traceback
 from datetime import datetime
 
+from snapshot_logging import get_snapshot_logger
+
 # Import our EXR converter
 CONVERTER_AVAILABLE = False
 converter_module = None
@@ -29,6 +34,10 @@ class RedshiftSnapshotConfig:
     # The folder where Redshift saves EXR snapshots
     RS_SNAPSHOT_DIR = r"C:\cache\rs snapshots"
 
+    # Snapshots Redshift already saved tone-mapped to 8-bit (copied, not converted)
+    DISPLAY_READY_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+    SNAPSHOT_EXTENSIONS = ('.exr',) + DISPLAY_READY_EXTENSIONS
+
     @staticmethod
     def get_scene_snapshot_dir(doc, artist_name):
         """
@@ -61,7 +70,6 @@ class RedshiftSnapshotConfig:
 
             return output_dir
         except Exception as e:
-            import traceback
             print(f"Error creating snapshot directory: {e}")
             traceback.print_exc()
             # Try a simpler fallback
@@ -85,71 +93,58 @@ class RedshiftSnapshotManager:
 
     def _init_logging(self):
         """Initialize file logging for debugging"""
-        try:
-            # Create log directory if it doesn't exist
-            log_dir = os.path.dirname(self.log_file)
-            if not os.path.exists(log_dir):
-                os.makedirs(log_dir)
-
-            # Write initial log entry
-            with open(self.log_file, 'a') as f:
-                f.write(f"\n{'='*60}\n")
-                f.write(f"YS Guardian Snapshot Manager - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"{'='*60}\n")
-                f.write(f"Initialized with RS_SNAPSHOT_DIR: {self.rs_dir}\n")
-        except Exception as e:
-            print(f"Warning: Could not initialize logging: {e}")
+        # One shared logger/file handle for the manager and the converter,
+        # instead of reopening the log file for every line
+        self._logger = get_snapshot_logger(self.log_file)
+
+        # Write initial log entry
+        self._logger.info('=' * 60)
+        self._logger.info(f"YS Guardian Snapshot Manager - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        self._logger.info('=' * 60)
+        self._logger.info(f"Initialized with RS_SNAPSHOT_DIR: {self.rs_dir}")
 
     def _log(self, message):
         """Write a message to both console and log file"""
         print(message)
-        try:
-            with open(self.log_file, 'a') as f:
-                f.write(f"[{datetime.now().strftime('%H:%M:%S')}] {message}\n")
-        except:
-            pass  # Fail silently if logging fails
+        self._logger.info(message)
 
-    def find_latest_exr(self):
-        """Find the most recent EXR file in the Redshift snapshot directory"""
+    def find_latest_snapshot(self):
+        """Find the most recent snapshot (EXR, or PNG/JPG) in the Redshift snapshot directory"""
         if not os.path.exists(self.rs_dir):
             self._log(f"Snapshot directory not found: {self.rs_dir}")
             return None
 
         try:
-            # Find all EXR files
-            exr_files = []
-            self._log(f"Searching for EXR files in {self.rs_dir}")
-            for file in os.listdir(self.rs_dir):
-                if file.lower().endswith('.exr'):
-                    full_path = os.path.join(self.rs_dir, file)
-                    # Get modification time
-                    mtime = os.path.getmtime(full_path)
-                    exr_files.append((full_path, mtime))
-                    self._log(f"  Found: {file} (modified: {datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')})")
-
-            if not exr_files:
-                self._log(f"No EXR files found in {self.rs_dir}")
+            # Find all snapshot files
+            snapshot_files = []
+            self._log(f"Searching for snapshots in {self.rs_dir}")
+            with os.scandir(self.rs_dir) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(RedshiftSnapshotConfig.SNAPSHOT_EXTENSIONS):
+                        # Get modification time (cached on the directory entry)
+                        mtime = entry.stat().st_mtime
+                        snapshot_files.append((entry.path, mtime))
+                        self._log(f"  Found: {entry.name} (modified: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(mtime))})")
+
+            if not snapshot_files:
+                self._log(f"No snapshots found in {self.rs_dir}")
                 return None
 
-            # Sort by modification time (newest first)
-            exr_files.sort(key=lambda x: x[1], reverse=True)
-
             # Return the newest file
-            latest_file = exr_files[0][0]
-            self._log(f"Selected latest EXR: {os.path.basename(latest_file)}")
+            latest_file = max(snapshot_files, key=lambda x: x[1])[0]
+            self._log(f"Selected latest snapshot: {os.path.basename(latest_file)}")
             return latest_file
 
         except Exception as e:
-            self._log(f"Error finding EXR files: {e}")
-            import traceback
+            self._log(f"Error finding snapshots: {e}")
             self._log(f"Traceback: {traceback.format_exc()}")
             return None
 
     def process_snapshot(self, doc, artist_name):
         """
         Main function to process a snapshot:
-        1. Find latest EXR in cache folder
-        2. Convert to PNG
+        1. Find latest snapshot in cache folder
+        2. Convert to PNG (PNG/JPG snapshots are copied as-is)
         3. Save to artist's daily folder
         """
         self._log("=" * 40)
@@ -157,15 +152,10 @@ class RedshiftSnapshotManager:
         self._log(f"Artist: {artist_name}")
         self._log(f"Converter module: {converter_module if converter_module else 'None available'}")
 
-        if not CONVERTER_AVAILABLE:
-            error_msg = "EXR converter not available. Please install OpenEXR."
-            self._log(f"Error: {error_msg}")
-            return None, error_msg
-
-        # Find the latest EXR file
-        exr_path = self.find_latest_exr()
+        # Find the latest snapshot file
+        exr_path = self.find_latest_snapshot()
         if not exr_path:
-            error_msg = "No EXR snapshots found in cache folder.\nPlease take a snapshot in Redshift RenderView first."
+            error_msg = "No snapshots found in cache folder.\nPlease take a snapshot in Redshift RenderView first."
             self._log(f"Error: {error_msg}")
             return None, error_msg
 
@@ -199,22 +189,34 @@ class RedshiftSnapshotManager:
             output_filename = f"{scene_name}.png"
             output_path = os.path.join(output_dir, output_filename)
 
-            # Convert EXR to PNG
-            self._log(f"Converting {os.path.basename(exr_path)} to PNG...")
-            self._log(f"  From: {exr_path}")
-            self._log(f"  To: {output_path}")
+            source_ext = os.path.splitext(exr_path)[1].lower()
+            if source_ext in RedshiftSnapshotConfig.DISPLAY_READY_EXTENSIONS:
+                # Already tone-mapped by Redshift: a plain file copy, no decode/re-encode
+                output_path = os.path.join(output_dir, f"{scene_name}{source_ext}")
+                self._log(f"Copying display-ready snapshot {os.path.basename(exr_path)}...")
+                self._log(f"  From: {exr_path}")
+                self._log(f"  To: {output_path}")
+                shutil.copyfile(exr_path, output_path)
+                success = True
+            else:
+                if not CONVERTER_AVAILABLE:
+                    error_msg = "EXR converter not available. Please install OpenEXR."
+                    self._log(f"Error: {error_msg}")
+                    return None, error_msg
 
-            # Import traceback for better error reporting
-            import traceback
+                # Convert EXR to PNG
+                self._log(f"Converting {os.path.basename(exr_path)} to PNG...")
+                self._log(f"  From: {exr_path}")
+                self._log(f"  To: {output_path}")
 
-            try:
-                self._log("Calling convert_exr_to_png...")
-                success = convert_exr_to_png(exr_path, output_path)
-                self._log(f"Conversion result: {success}")
-            except Exception as conv_error:
-                self._log(f"Conversion exception: {conv_error}")
-                self._log(f"Traceback: {traceback.format_exc()}")
-                return None, f"Conversion error: {str(conv_error)}"
+                try:
+                    self._log("Calling convert_exr_to_png...")
+                    success = convert_exr_to_png(exr_path, output_path)
+                    self._log(f"Conversion result: {success}")
+                except Exception as conv_error:
+                    self._log(f"Conversion exception: {conv_error}")
+                    self._log(f"Traceback: {traceback.format_exc()}")
+                    return None, f"Conversion error: {str(conv_error)}"
 
             if success:
                 # Mark as processed
@@ -237,7 +239,6 @@ class RedshiftSnapshotManager:
                     return None, "Failed to convert EXR to PNG - check log file at C:\\YS_Guardian_Output\\snapshot_log.txt"
 
         except Exception as e:
-            import traceback
             self._log(f"Error processing snapshot: {e}")
             self._log(f"Traceback: {traceback.format_exc()}")
             return None, f"Error: {str(e)}"
@@ -250,11 +251,10 @@ class RedshiftSnapshotManager:
         try:
             # Find all EXR files
             exr_files = []
-            for file in os.listdir(self.rs_dir):
-                if file.lower().endswith('.exr'):
-                    full_path = os.path.join(self.rs_dir, file)
-                    mtime = os.path.getmtime(full_path)
-                    exr_files.append((full_path, mtime))
+            with os.scandir(self.rs_dir) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith('.exr'):
+                        exr_files.append((entry.path, entry.stat().st_mtime))
 
             # Sort by modification time (newest first)
             exr_files.sort(key=lambda x: x[1], reverse=True)
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Shared snapshot log for YS Guardian
+Used by both the snapshot manager and the EXR converter bridge
+"""
+
+import os
+import logging
+
+LOG_FILE = r"C:\YS_Guardian_Output\snapshot_log.txt"
+
+
+def get_snapshot_logger(log_file=LOG_FILE):
+    """Get the shared snapshot logger, opening each log file once per session"""
+    logger = logging.getLogger('ysg')
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    # Already writing to this file
+    log_path = os.path.abspath(log_file)
+    for handler in logger.handlers:
+        if getattr(handler, 'baseFilename', None) == log_path:
+            return logger
+
+    try:
+        os.makedirs(os.path.dirname(log_file), exist_ok=True)
+        handler = logging.FileHandler(log_file, delay=True)
+        handler.setFormatter(logging.Formatter('[%(asctime)s] %(message)s', '%H:%M:%S'))
+        logger.addHandler(handler)
+    except Exception as e:
+        print(f"Warning: Could not initialize logging: {e}")
+        if not logger.handlers:
+            logger.addHandler(logging.NullHandler())
+    return logger